@@ -0,0 +1,50 @@
+"""Benchmark and demo for the SQLite logging handlers.
+
+Logs a burst of records through SqliteHandler and through
+BufferingSqliteHandler against a temporary file database and prints the
+wall time of each, so the effect of transaction batching is visible.
+
+Run from the repository root:
+
+    python -m examples.bench_sqlite_handler [record_count]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sql_logger import BufferingSqliteHandler, SqliteHandler
+
+
+def bench(handler: logging.Handler, name: str, count: int) -> None:
+    """Send count records through handler and print the elapsed time."""
+    logger = logging.Logger(name)
+    logger.addHandler(handler)
+    start = time.perf_counter()
+    for i in range(count):
+        logger.info("benchmark message %d", i)
+    handler.close()
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {count} records in {elapsed:.3f}s "
+          f"({count / elapsed:,.0f} records/s)")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        bench(
+            SqliteHandler(Path(tmpdir) / "plain.db"),
+            "SqliteHandler",
+            count,
+        )
+        bench(
+            BufferingSqliteHandler(Path(tmpdir) / "buffered.db"),
+            "BufferingSqliteHandler",
+            count,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Package to save logs from the logging built in module to SQLite."""
+
+from sql_logger.sql_logger import BufferingSqliteHandler, SqliteHandler
+
+__all__ = ["BufferingSqliteHandler", "SqliteHandler"]
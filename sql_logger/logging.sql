@@ -0,0 +1,29 @@
+CREATE TABLE IF NOT EXISTS log_record (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    args TEXT,
+    asctime TEXT,
+    asctime_utc TEXT GENERATED ALWAYS AS (
+        strftime('%Y-%m-%d %H:%M:%f', created, 'unixepoch')
+    ) VIRTUAL,
+    created REAL,
+    exc_info TEXT,
+    exc_text TEXT,
+    filename TEXT,
+    funcName TEXT,
+    levelname TEXT,
+    levelno INTEGER,
+    lineno INTEGER,
+    message TEXT,
+    module TEXT,
+    msecs REAL,
+    msg TEXT,
+    name TEXT,
+    pathname TEXT,
+    process INTEGER,
+    processName TEXT,
+    relativeCreated REAL,
+    stack_info TEXT,
+    thread INTEGER,
+    threadName TEXT,
+    taskName TEXT
+);
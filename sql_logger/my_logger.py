@@ -0,0 +1,162 @@
+"""Logger with optional file, console and SQLite database output.
+
+Provides `MyLogger`, a `logging.Logger` subclass that wires up its own
+handlers, and `make_async_sqlite_logger`, a factory that moves SQLite
+writes off the logging hot path with a queue and a listener thread.
+"""
+
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from typing import Tuple, Union
+
+from sql_logger.sql_logger import BufferingSqliteHandler, SqliteHandler
+
+# Formatters are immutable in practice; share one of each across all
+# MyLogger instances instead of allocating them per logger.
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s|%(name)s|%(levelname)s|%(message)s"
+)
+_CONSOLE_FORMATTER = logging.Formatter("%(message)s")
+
+# File handlers keyed by log file path, reused across loggers so each
+# file is opened once per process.
+_FILE_HANDLERS = {}
+
+
+class MyLogger(logging.Logger):
+    """Logger that can log to a file, the console and a SQLite database."""
+
+    def __init__(
+        self,
+        name: str,
+        level: int = logging.NOTSET,
+        log_file: Union[str, Path] = "logger.log",
+        log_to_file: bool = False,
+        log_to_console: bool = True,
+        database_file: Union[str, Path] = ":memory:",
+        initial_database_script: Union[str, Path] = None,
+    ) -> None:
+        """Initialize the logger and attach the requested handlers.
+
+        Args:
+            name: Name of the logger.
+            level: Minimum level this logger handles.
+            log_file: Path of the plain-text log file.
+            log_to_file: Attach a FileHandler when True.
+            log_to_console: Attach a StreamHandler when True.
+            database_file: Path to the database file, or ":memory:" for
+                an in-memory database.
+            initial_database_script: Optional path to a SQL script that
+                is run against the database before any records are
+                logged.
+        """
+        super().__init__(name, level)
+        self.log_file = None
+        if log_file is None:
+            raise ValueError("log_file must not be None.")
+        if isinstance(log_file, Path):
+            self.log_file = log_file
+        elif isinstance(log_file, str):
+            if log_file == "":
+                raise ValueError("log_file must not be empty.")
+            self.log_file = Path(log_file)
+        else:
+            raise TypeError("log_file must be a str or pathlib.Path.")
+        self.initial_database_script = None
+        if isinstance(initial_database_script, Path):
+            self.initial_database_script = initial_database_script
+        elif isinstance(initial_database_script, str):
+            if initial_database_script == "":
+                raise ValueError("initial_database_script must not be empty.")
+            self.initial_database_script = Path(initial_database_script)
+        elif initial_database_script is not None:
+            raise TypeError(
+                "initial_database_script must be a str or pathlib.Path."
+            )
+        if log_to_file:
+            file_handler = _FILE_HANDLERS.get(self.log_file)
+            if file_handler is None:
+                file_handler = logging.FileHandler(self.log_file)
+                file_handler.setFormatter(_FILE_FORMATTER)
+                _FILE_HANDLERS[self.log_file] = file_handler
+            self.addHandler(file_handler)
+            if self.isEnabledFor(logging.DEBUG):
+                self.debug("File logging enabled")
+        if log_to_console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            self.addHandler(console_handler)
+            if self.isEnabledFor(logging.DEBUG):
+                self.debug("Console logging enabled")
+        sqlite_handler = SqliteHandler(database_file)
+        if self.initial_database_script is not None:
+            sqlite_handler.open()
+            sqlite_handler.connection.executescript(
+                self.initial_database_script.read_text("utf-8")
+            )
+        self.addHandler(sqlite_handler)
+        if self.isEnabledFor(logging.DEBUG):
+            self.debug("Logger initialized")
+
+
+class _SqliteQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() also closes its handlers.
+
+    QueueListener.stop() only drains the queue; records still buffered
+    in a BufferingSqliteHandler would otherwise not reach the database
+    until logging.shutdown() at interpreter exit.
+    """
+
+    def stop(self) -> None:
+        super().stop()
+        for handler in self.handlers:
+            handler.close()
+
+
+def make_async_sqlite_logger(
+    name: str,
+    database_file: Union[str, Path] = ":memory:",
+    queue_size: int = 10000,
+) -> Tuple[logging.Logger, logging.handlers.QueueListener]:
+    """Build a logger whose SQLite writes run on a listener thread.
+
+    The returned logger only pays for a queue.put per call; a listener
+    thread drains the queue into a BufferingSqliteHandler, so the
+    caller never blocks on a commit or fsync and consecutive records
+    are written in batched transactions. The caller should stop the
+    listener on shutdown; stop() drains the queue and closes the
+    handler, so every accepted record is in the database when it
+    returns.
+
+    Args:
+        name: Name of the logger.
+        database_file: Path to the database file, or ":memory:" for an
+            in-memory database.
+        queue_size: Maximum number of records queued before callers
+            block.
+
+    Returns:
+        A (logger, listener) tuple; the listener is already started.
+
+    Raises:
+        ValueError: If the named logger already has a QueueHandler,
+            which would duplicate every record.
+    """
+    logger = logging.getLogger(name)
+    if any(
+        isinstance(handler, logging.handlers.QueueHandler)
+        for handler in logger.handlers
+    ):
+        raise ValueError(f"Logger {name!r} already has a QueueHandler.")
+    record_queue = queue.Queue(maxsize=queue_size)
+    logger.addHandler(logging.handlers.QueueHandler(record_queue))
+    # The buffering handler turns the listener's record-at-a-time
+    # handle() calls into batched insert_log_many transactions.
+    sqlite_handler = BufferingSqliteHandler(database_file)
+    listener = _SqliteQueueListener(
+        record_queue, sqlite_handler, respect_handler_level=True
+    )
+    listener.start()
+    return logger, listener
@@ -0,0 +1,417 @@
+"""SQLite handler for the standard logging module.
+
+Provides `SqliteHandler`, which stores log records in a `log_record`
+table of a SQLite database, and `BufferingSqliteHandler`, which buffers
+records in memory and writes each batch in a single transaction.
+"""
+
+import functools
+import logging
+import logging.handlers
+import sqlite3
+import time
+from pathlib import Path
+from typing import Mapping, Union
+
+# LogRecord attributes that map to log_record columns, in insert order.
+# taskName only exists on Python 3.12+; _record_row's dict.get falls
+# back to None for it on older versions.
+_LOGRECORD_ATTRS = (
+    "name",
+    "msg",
+    "args",
+    "levelname",
+    "levelno",
+    "pathname",
+    "filename",
+    "module",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+    "lineno",
+    "funcName",
+    "created",
+    "msecs",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "processName",
+    "process",
+    "taskName",
+)
+
+# Types sqlite3 binds natively; anything else is stringified. An exact
+# type() lookup in a frozenset beats an isinstance() tuple scan on the
+# per-attribute hot path.
+_NATIVE_TYPES = frozenset({str, int, float, bytes, bool, type(None)})
+
+# Parent directories already known to exist, so repeated handler
+# construction skips the stat/mkdir syscall pair.
+_KNOWN_DIRS = set()
+
+
+@functools.cache
+def _init_sql() -> str:
+    """Read the schema script once per process and reuse the text."""
+    return (Path(__file__).parent / "logging.sql").read_text("utf-8")
+
+
+def _coerce_db_path(value: Union[str, Path]) -> Union[str, Path]:
+    """Normalize a database file argument to ":memory:" or a Path.
+
+    Creates the parent directory of a file path if it does not exist
+    yet; the ":memory:" case touches no filesystem state at all.
+
+    Raises:
+        ValueError: If value is None or an empty string.
+        TypeError: If value is not a str or pathlib.Path.
+    """
+    if value == ":memory:":
+        return value
+    if value is None:
+        raise ValueError("database_file must not be None.")
+    if isinstance(value, str):
+        if value == "":
+            raise ValueError("database_file must not be empty.")
+        value = Path(value)
+    elif not isinstance(value, Path):
+        raise TypeError("database_file must be a str or pathlib.Path.")
+    parent = value.parent
+    if parent not in _KNOWN_DIRS:
+        if parent != Path() and not parent.exists():
+            parent.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(parent)
+    return value
+
+
+class SqliteHandler(logging.Handler):
+    """Logging handler that saves log records to a SQLite database."""
+
+    def __init__(
+        self,
+        database_file: Union[str, Path] = ":memory:",
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            database_file: Path to the database file, or ":memory:" for
+                an in-memory database.
+            journal_mode: Journal mode PRAGMA for file databases. WAL
+                appends to a sequential log instead of rewriting pages
+                and lets readers run while a writer commits.
+            synchronous: Synchronous PRAGMA for file databases. NORMAL
+                skips one fsync per commit compared to FULL; OFF skips
+                them all when durability does not matter.
+        """
+        super().__init__()
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.database_file = _coerce_db_path(database_file)
+        self.connection = None
+        self.cursor = None
+        self._columns = None
+        self._columns_cache = {}
+        self._attr_order = ()
+        self._insert_sql = ""
+        self._buf_rows = []
+        self._last_sec = -1
+        self._last_local_prefix = ""
+
+    def _ensure_open(self) -> None:
+        """Open the database connection on first use and keep it open."""
+        if self.connection is None:
+            self.open()
+
+    def open(self) -> None:
+        """Open the database connection and make sure the schema exists."""
+        # isolation_level=None stops the sqlite3 module from opening
+        # implicit transactions; batches drive BEGIN IMMEDIATE/COMMIT
+        # themselves and single inserts autocommit.
+        if self.database_file == ":memory:":
+            # Shared-cache URI so every in-memory handler in the
+            # process writes into one database with one pager and one
+            # schema, instead of a private database per handler.
+            self.connection = sqlite3.connect(
+                "file::memory:?cache=shared",
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+        else:
+            self.connection = sqlite3.connect(
+                self.database_file,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+        self.connection.row_factory = sqlite3.Row
+        if self.database_file != ":memory:":
+            self.connection.executescript(
+                f"PRAGMA journal_mode={self.journal_mode};"
+                f"PRAGMA synchronous={self.synchronous};"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA busy_timeout=5000;"
+            )
+        self.cursor = self.connection.cursor()
+        self.create_logging_table()
+        self._columns = frozenset(self.get_columns("log_record"))
+        self._attr_order = tuple(
+            attribute
+            for attribute in _LOGRECORD_ATTRS
+            if attribute in self._columns
+        )
+        insert_columns = ("message", "asctime") + self._attr_order
+        self._insert_sql = (
+            f"INSERT INTO log_record ({', '.join(insert_columns)}) "
+            f"VALUES ({', '.join(['?'] * len(insert_columns))});"
+        )
+
+    def flush(self) -> None:
+        """Write any buffered rows and commit pending database work."""
+        self.acquire()
+        try:
+            if self.connection is None:
+                return
+            rows = self._buf_rows
+            if rows:
+                try:
+                    if len(rows) == 1:
+                        self.cursor.execute(self._insert_sql, rows[0])
+                    else:
+                        self.cursor.execute("BEGIN IMMEDIATE;")
+                        try:
+                            self.cursor.executemany(self._insert_sql, rows)
+                        except Exception:
+                            self.cursor.execute("ROLLBACK;")
+                            raise
+                        self.cursor.execute("COMMIT;")
+                finally:
+                    rows.clear()
+            if self.connection.in_transaction:
+                self.connection.commit()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Flush pending work and close the database connection."""
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+            self.cursor = None
+            self._columns = None
+            self._columns_cache.clear()
+        super().close()
+
+    def __del__(self) -> None:
+        # connection is missing when __init__ raised during validation.
+        connection = getattr(self, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.connection = None
+            self.cursor = None
+
+    def create_logging_table(self) -> None:
+        """Create the log_record table if it does not exist yet.
+
+        The whole schema is one CREATE TABLE statement run in a single
+        executescript round-trip, so creation cost does not grow with
+        the number of columns.
+        """
+        self.connection.executescript(_init_sql())
+
+    def get_tables(self) -> list:
+        """Return the names of the user tables in the database."""
+        self._ensure_open()
+        # Plain tuples skip the sqlite3.Row allocation per fetched row;
+        # named access is not needed for these schema queries.
+        self.cursor.row_factory = None
+        try:
+            self.cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name NOT LIKE 'sqlite_%';"
+            )
+            return [row[0] for row in self.cursor.fetchall()]
+        finally:
+            self.cursor.row_factory = sqlite3.Row
+
+    def get_columns(self, table: str) -> list:
+        """Return the column names of the given table.
+
+        The result is cached per table for the life of the connection,
+        since the schema does not change under the handler; callers
+        must not mutate the returned list.
+        """
+        self._ensure_open()
+        columns = self._columns_cache.get(table)
+        if columns is None:
+            self.cursor.row_factory = None
+            try:
+                self.cursor.execute(f"PRAGMA table_info({table});")
+                columns = [row[1] for row in self.cursor.fetchall()]
+            finally:
+                self.cursor.row_factory = sqlite3.Row
+            self._columns_cache[table] = columns
+        return columns
+
+    def insert_log(self, values: Mapping) -> None:
+        """Insert one row built from a column name to value mapping."""
+        self._ensure_open()
+        columns = list(values.keys())
+        sql = (
+            f"INSERT INTO log_record ({', '.join(columns)}) "
+            f"VALUES ({', '.join(['?'] * len(columns))});"
+        )
+        self.cursor.execute(sql, list(values.values()))
+
+    def insert_log_many(self, rows: list) -> None:
+        """Insert many rows in one transaction with the prepared INSERT.
+
+        Each row must match the prepared statement's column order:
+        message, asctime, then the attributes in self._attr_order, as
+        produced by _record_row().
+        """
+        self._ensure_open()
+        self.cursor.execute("BEGIN IMMEDIATE;")
+        try:
+            self.cursor.executemany(self._insert_sql, rows)
+        except Exception:
+            self.cursor.execute("ROLLBACK;")
+            raise
+        self.cursor.execute("COMMIT;")
+
+    def _record_row(self, record: logging.LogRecord) -> tuple:
+        """Build one row of values in the prepared INSERT column order."""
+        # LogRecord keeps its data attributes in __dict__; a dict.get
+        # per attribute skips the descriptor lookup getattr would do.
+        data = record.__dict__
+        values = [record.getMessage(), self._format_asctime(record.created)]
+        for attribute in self._attr_order:
+            value = data.get(attribute)
+            if type(value) not in _NATIVE_TYPES:
+                value = str(value)
+            values.append(value)
+        return tuple(values)
+
+    def _format_asctime(self, timestamp: float) -> str:
+        """Return the local-time asctime string for a Unix timestamp.
+
+        Consecutive records usually fall within the same second, so the
+        second-resolution prefix is cached and only the millisecond
+        suffix is rebuilt per record. The UTC variant is a generated
+        column computed by SQLite, so it costs nothing here.
+        """
+        sec = int(timestamp)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_local_prefix = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(sec)
+            )
+        return self._last_local_prefix + f",{int((timestamp - sec) * 1000):03d}"
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Save a log record to the database.
+
+        The row is appended to a struct-of-arrays buffer and flushed
+        straight away; subclasses can defer the flush() call to batch
+        several rows into one transaction. Failures are routed through
+        handleError() per the logging.Handler contract, so a bad format
+        string or a locked database never crashes the caller.
+        """
+        if not self.filter(record):
+            return
+        try:
+            self._ensure_open()
+            self._buf_rows.append(self._record_row(record))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class BufferingSqliteHandler(logging.handlers.BufferingHandler):
+    """Handler that batches log records into single-transaction inserts.
+
+    Records are buffered in memory and written with one `executemany`
+    call inside a single transaction, which amortizes the per-commit
+    fsync across the whole batch. The buffer is flushed when it reaches
+    `capacity` records, when a record of `flushLevel` or above arrives,
+    or when more than `flushInterval` seconds have passed since the
+    last flush. Any remaining records are flushed on `close()`, which
+    `logging.shutdown()` calls at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        database_file: Union[str, Path] = ":memory:",
+        capacity: int = 100,
+        flushLevel: int = logging.ERROR,
+        flushInterval: float = 1.0,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            database_file: Path to the database file, or ":memory:" for
+                an in-memory database.
+            capacity: Number of buffered records that triggers a flush.
+            flushLevel: Level at or above which a record forces a flush.
+            flushInterval: Seconds after which the next record forces a
+                flush regardless of the buffer size.
+            journal_mode: Journal mode PRAGMA for file databases.
+            synchronous: Synchronous PRAGMA for file databases.
+        """
+        super().__init__(capacity)
+        self.flushLevel = flushLevel
+        self.flushInterval = flushInterval
+        self._handler = SqliteHandler(database_file, journal_mode, synchronous)
+        self._last_flush = time.monotonic()
+
+    def open(self) -> None:
+        """Open the underlying handler's connection."""
+        self._handler.open()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush on a full buffer, a severe record, or an expired interval."""
+        return (
+            len(self.buffer) >= self.capacity
+            or record.levelno >= self.flushLevel
+            or time.monotonic() - self._last_flush >= self.flushInterval
+        )
+
+    def flush(self) -> None:
+        """Write all buffered records in a single transaction.
+
+        A failed batch is reported through handleError() and dropped;
+        keeping it around would only make every later flush re-fail on
+        the same rows.
+        """
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            try:
+                self._handler._ensure_open()
+                rows = [
+                    self._handler._record_row(record)
+                    for record in self.buffer
+                ]
+                self._handler.insert_log_many(rows)
+            except Exception:
+                self.handleError(self.buffer[-1])
+            finally:
+                self.buffer.clear()
+                self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Flush the remaining records and close the connection."""
+        try:
+            super().close()
+        finally:
+            self._handler.close()
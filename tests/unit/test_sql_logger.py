@@ -0,0 +1,247 @@
+"""Unit tests for sql_logger.sql_logger."""
+
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from types import MappingProxyType
+
+from sql_logger.sql_logger import SqliteHandler
+
+# Single source of truth for the log_record schema columns, in PRAGMA
+# table_info order. Virtual generated columns (asctime_utc) are not
+# reported by table_info and are therefore not listed here.
+EXPECTED_COLUMNS = (
+    "id",
+    "args",
+    "asctime",
+    "created",
+    "exc_info",
+    "exc_text",
+    "filename",
+    "funcName",
+    "levelname",
+    "levelno",
+    "lineno",
+    "message",
+    "module",
+    "msecs",
+    "msg",
+    "name",
+    "pathname",
+    "process",
+    "processName",
+    "relativeCreated",
+    "stack_info",
+    "thread",
+    "threadName",
+    "taskName",
+)
+
+# Markers for the construction cases below: "no argument passed" and
+# the shared temporary database path (as Path and as str), which only
+# exists once the class fixture has run.
+_DEFAULT = object()
+_TMP_DB = object()
+_TMP_DB_STR = object()
+
+# (argument, expected type of handler.database_file)
+INIT_CASES = (
+    (_DEFAULT, str),
+    (":memory:", str),
+    (_TMP_DB, Path),
+    (_TMP_DB_STR, Path),
+)
+
+# (argument, expected exception)
+INIT_ERROR_CASES = (
+    (1, TypeError),
+    ("", ValueError),
+    (None, ValueError),
+)
+
+
+# Read-only row template for insert_log tests; tests that need to
+# mutate it should take a dict(...) copy.
+_LOG_VALUES = MappingProxyType(
+    {
+        "args": None,
+        "asctime": "2021-10-10 10:10:10,000",
+        "created": 1633860610.0,
+        "exc_info": None,
+        "exc_text": None,
+        "filename": "test_sql_logger.py",
+        "funcName": "test_insert_log",
+        "levelname": "INFO",
+        "levelno": 20,
+        "lineno": 100,
+        "message": "test message",
+        "module": "test_sql_logger",
+        "msecs": 0.0,
+        "msg": "test message",
+        "name": "test_logger",
+        "pathname": "tests/unit/test_sql_logger.py",
+        "process": 1234,
+        "processName": "MainProcess",
+        "relativeCreated": 10.0,
+        "stack_info": None,
+        "thread": 123456,
+        "threadName": "MainThread",
+        "taskName": None,
+    }
+)
+
+# Columns where the handler stringifies non-native values (tuples,
+# tracebacks) before insert; None passes through as NULL.
+_STRING_COLS = frozenset({"args", "exc_info", "exc_text", "stack_info"})
+
+# Columns test_emit does not compare against record attributes: the
+# rowid, the derived timestamp strings and the rendered message.
+_IGNORED_EMIT_COLS = frozenset({"id", "asctime", "asctime_utc", "message"})
+
+# Shared SQL texts: reusing the exact same string lets sqlite3's
+# statement cache hit instead of re-parsing per call.
+SELECT_ALL_SQL = "SELECT * FROM log_record;"
+SELECT_FIRST_SQL = "SELECT * FROM log_record ORDER BY id LIMIT 1;"
+COUNT_SQL = "SELECT COUNT(*) FROM log_record;"
+DELETE_ALL_SQL = "DELETE FROM log_record;"
+
+
+def _make_fast_handler(database_file=":memory:"):
+    """Open a handler with durability disabled.
+
+    Tests never need their writes to survive a crash, so the journal is
+    kept in memory and fsync is turned off; any file-backed test runs
+    without paying for disk flushes.
+    """
+    handler = SqliteHandler(
+        database_file, journal_mode="MEMORY", synchronous="OFF"
+    )
+    handler.open()
+    handler.cursor.executescript(
+        "PRAGMA journal_mode=MEMORY;"
+        "PRAGMA synchronous=OFF;"
+        "PRAGMA temp_store=MEMORY;"
+    )
+    return handler
+
+
+class TestSqliteHandler(unittest.TestCase):
+    """Tests for SqliteHandler.
+
+    A single in-memory handler is shared across the class and reset
+    between tests, so the suite pays for one connection open and one
+    schema creation instead of one per test. Tests that exercise
+    construction semantics build their own short-lived handlers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = _make_fast_handler()
+        # Schema as reported by the shared handler; the spec-level
+        # check against the EXPECTED_COLUMNS literal lives in
+        # test_get_columns only.
+        cls._reference_columns = tuple(cls.handler.get_columns("log_record"))
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls._dbpath = Path(cls._tmpdir.name, "logging.db")
+        # LogRecord.__init__ hits os.getpid(), time.time() and the
+        # thread/process registries; build it once and copy cheaply
+        # with makeLogRecord per subtest.
+        cls._template_record = logging.LogRecord(
+            "test_logger",
+            logging.INFO,
+            "test_sql_logger.py",
+            100,
+            "test message",
+            None,
+            None,
+            "test_emit",
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.handler.close()
+        cls._tmpdir.cleanup()
+
+    def setUp(self):
+        self.handler = type(self).handler
+        self.handler.cursor.execute(DELETE_ALL_SQL)
+
+    def test___init__(self):
+        for argument, expected_type in INIT_CASES:
+            if argument is _TMP_DB:
+                argument = self._dbpath
+            elif argument is _TMP_DB_STR:
+                argument = str(self._dbpath)
+            with self.subTest(argument=argument):
+                if argument is _DEFAULT:
+                    handler = SqliteHandler()
+                else:
+                    handler = SqliteHandler(argument)
+                self.assertIsInstance(handler.database_file, expected_type)
+        for argument, expected_error in INIT_ERROR_CASES:
+            with self.subTest(argument=argument):
+                with self.assertRaises(expected_error):
+                    SqliteHandler(argument)
+
+    def test_get_columns(self):
+        columns = self.handler.get_columns("log_record")
+        self.assertEqual(columns, list(EXPECTED_COLUMNS))
+
+    def test_create_logging_table(self):
+        self.handler.create_logging_table()
+        columns = self.handler.get_columns("log_record")
+        self.assertEqual(tuple(columns), type(self)._reference_columns)
+
+    def test_get_tables(self):
+        tables = self.handler.get_tables()
+        self.assertEqual(tables, ["log_record"])
+
+    def test_insert_log(self):
+        values = _LOG_VALUES
+        for count in (1, 1000):
+            with self.subTest(count=count):
+                self.handler.cursor.execute(DELETE_ALL_SQL)
+                self.handler.connection.execute("BEGIN;")
+                for _ in range(count):
+                    self.handler.insert_log(values)
+                self.handler.connection.commit()
+                self.handler.cursor.execute(COUNT_SQL)
+                self.assertEqual(self.handler.cursor.fetchone()[0], count)
+                self.handler.cursor.execute(SELECT_FIRST_SQL)
+                result = self.handler.cursor.fetchone()
+                actual = {
+                    key: result[key] for key in result.keys() if key in values
+                }
+                self.assertEqual(actual, values)
+
+    def test_emit(self):
+        levels = (
+            logging.DEBUG,
+            logging.INFO,
+            logging.WARNING,
+            logging.ERROR,
+            logging.CRITICAL,
+        )
+        for level in levels:
+            with self.subTest(level=logging.getLevelName(level)):
+                self.handler.cursor.execute(DELETE_ALL_SQL)
+                record = logging.makeLogRecord(
+                    type(self)._template_record.__dict__
+                )
+                record.levelno = level
+                record.levelname = logging.getLevelName(level)
+                self.handler.emit(record)
+                self.handler.cursor.execute(SELECT_ALL_SQL)
+                result = self.handler.cursor.fetchone()
+                for key in result.keys():
+                    if key in _IGNORED_EMIT_COLS:
+                        continue
+                    expected = getattr(record, key, None)
+                    if key in _STRING_COLS and expected is not None:
+                        expected = str(expected)
+                    self.assertEqual(result[key], expected, key)
+
+
+if __name__ == "__main__":
+    unittest.main()